@@ -2,30 +2,145 @@
 if "__omp_prelude_loaded__" not in globals():
     __omp_prelude_loaded__ = True
     from pathlib import Path
-    import os, re, json, shutil, subprocess, inspect
+    import fnmatch
+    import functools
+    import os, re, json, shutil, subprocess, inspect, array, bisect, mmap
     from datetime import datetime
+    from stat import S_ISDIR, S_ISREG
     from IPython.display import display
 
+    @functools.lru_cache(maxsize=256)
+    def _rx(pattern: str, flags: int = 0) -> re.Pattern:
+        """Compile-and-cache regex. Agents re-run the same patterns constantly."""
+        return re.compile(pattern, flags)
+
+    # A pattern without any of these metachars is a plain substring search.
+    _LITERAL_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+    # Files above this size are scanned through mmap: no decode, no second
+    # copy, and the kernel streams pages lazily. Small files skip mmap setup.
+    _MMAP_THRESHOLD = 1 << 20
+
+    def _mmap_ro(p: str | Path) -> tuple[int, mmap.mmap]:
+        """Open path read-only and map it. Caller closes both fd and map."""
+        fd = os.open(os.fspath(p), os.O_RDONLY)
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except Exception:
+            os.close(fd)
+            raise
+        return fd, mm
+
+    def _newline_index(data: bytes) -> array.array:
+        """Byte offset of every newline in data, for line lookups via bisect.
+
+        One bytes buffer plus an offset table replaces the per-line str list
+        that splitlines() would allocate.
+        """
+        arr = array.array("Q")
+        find = data.find
+        i = 0
+        while True:
+            j = find(b"\n", i)
+            if j < 0:
+                return arr
+            arr.append(j)
+            i = j + 1
+
+    def _line_count(data: bytes, nls: array.array) -> int:
+        """Total number of lines given data and its newline index."""
+        n = len(data)
+        return len(nls) + (1 if n and data[n - 1] != 0x0A else 0)
+
+    def _line_span(data: bytes, nls: array.array, line_no: int) -> tuple[int, int]:
+        """(start, end) byte offsets of 1-indexed line_no, newline excluded."""
+        start = 0 if line_no <= 1 else nls[line_no - 2] + 1
+        end = nls[line_no - 1] if line_no - 1 < len(nls) else len(data)
+        if end > start and data[end - 1] == 0x0D:  # strip \r of CRLF endings
+            end -= 1
+        return start, end
+
+    def _do_replace(data: str, pattern: str, repl: str, *, regex: bool = True, flags: int = 0) -> tuple[str, int]:
+        """Shared replace core for replace/sed/rsed. Returns (new_text, count).
+
+        A regex pattern with no metachars and a backreference-free repl is a
+        plain substring swap, so it drops to str.replace's C loop.
+        """
+        if regex:
+            if flags == 0 and "\\" not in repl and not _LITERAL_RE.search(pattern):
+                count = data.count(pattern)
+                return (data.replace(pattern, repl) if count else data, count)
+            return _rx(pattern, flags).subn(repl, data)
+        return data.replace(pattern, repl), data.count(pattern)
+
+    _POOL = None
+
+    def _pool():
+        """Shared thread pool for per-file scan work (file I/O releases the GIL)."""
+        global _POOL
+        if _POOL is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4))
+        return _POOL
+
+    # Below this many files the pool's dispatch overhead outweighs the overlap.
+    _POOL_MIN_FILES = 8
+
+    def _slurp(p: str | Path) -> str:
+        """Read a whole file as UTF-8 in one sized read, skipping BufferedIO/TextIOWrapper."""
+        fd = os.open(os.fspath(p), os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size) if size > 0 else b""
+            # Keep reading to EOF: procfs/sysfs files report st_size == 0
+            # despite having content, and files can grow after the fstat.
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                data += chunk
+        finally:
+            os.close(fd)
+        return data.decode("utf-8")
+
     def _emit_status(op: str, **data):
         """Emit structured status event for TUI rendering."""
         display({"application/x-omp-status": {"op": op, **data}}, raw=True)
 
+    # Helpers register here as they are decorated; the docs builder iterates
+    # this list instead of scanning every name in globals().
+    _CATEGORIZED: list = []
+
     def _category(cat: str):
         """Decorator to tag a prelude function with its category."""
         def decorator(fn):
             fn._omp_category = cat
+            _CATEGORIZED.append(fn)
             return fn
         return decorator
 
+    # Cached (len(os.environ), sorted items) for the no-arg env() listing.
+    # Invalidated on env() sets and on any size change; a same-size mutation
+    # made behind our back (direct os.environ writes) is accepted as stale.
+    _ENV_CACHE: tuple[int, list] | None = None
+
     @_category("Shell")
     def env(key: str | None = None, value: str | None = None):
         """Get/set environment variables."""
+        global _ENV_CACHE
         if key is None:
-            items = dict(sorted(os.environ.items()))
-            _emit_status("env", count=len(items), keys=list(items.keys())[:20])
+            n = len(os.environ)
+            if _ENV_CACHE is not None and _ENV_CACHE[0] == n:
+                sorted_items = _ENV_CACHE[1]
+            else:
+                sorted_items = sorted(os.environ.items())
+                _ENV_CACHE = (n, sorted_items)
+            items = dict(sorted_items)
+            _emit_status("env", count=len(items), keys=[k for k, _ in sorted_items[:20]])
             return items
         if value is not None:
             os.environ[key] = value
+            _ENV_CACHE = None
             _emit_status("env", key=key, value=value, action="set")
             return value
         val = os.environ.get(key)
@@ -36,75 +151,96 @@ if "__omp_prelude_loaded__" not in globals():
     def read(path: str | Path, *, offset: int = 1, limit: int | None = None) -> str:
         """Read file contents. offset/limit are 1-indexed line numbers."""
         p = Path(path)
-        data = p.read_text(encoding="utf-8")
-        lines = data.splitlines(keepends=True)
+        data = _slurp(p)
+        # Only split into lines when a sub-range was actually requested.
         if offset > 1 or limit is not None:
+            lines = data.splitlines(keepends=True)
             start = max(0, offset - 1)
             end = start + limit if limit else len(lines)
-            lines = lines[start:end]
-            data = "".join(lines)
+            data = "".join(lines[start:end])
         preview = data[:500]
         _emit_status("read", path=str(p), chars=len(data), preview=preview)
         return data
 
+    def _write_fd(fd: int, data: bytes) -> None:
+        """Write all of data to fd, handling short writes."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
     @_category("File I/O")
     def write(path: str | Path, content: str) -> Path:
         """Write file contents (create parents)."""
-        p = Path(path)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(content, encoding="utf-8")
-        _emit_status("write", path=str(p), chars=len(content))
-        return p
+        s = os.fspath(path)
+        parent = os.path.dirname(s)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        fd = os.open(s, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            _write_fd(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+        _emit_status("write", path=s, chars=len(content))
+        return Path(s)
 
     @_category("File I/O")
     def append(path: str | Path, content: str) -> Path:
         """Append to file."""
-        p = Path(path)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("a", encoding="utf-8") as f:
-            f.write(content)
-        _emit_status("append", path=str(p), chars=len(content))
-        return p
+        s = os.fspath(path)
+        parent = os.path.dirname(s)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        fd = os.open(s, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+        try:
+            _write_fd(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+        _emit_status("append", path=s, chars=len(content))
+        return Path(s)
 
     @_category("File ops")
     def rm(path: str | Path, *, recursive: bool = False) -> None:
         """Delete file or directory (recursive optional)."""
-        p = Path(path)
-        if p.is_dir():
+        s = os.fspath(path)
+        if os.path.isdir(s):
             if recursive:
-                shutil.rmtree(p)
-                _emit_status("rm", path=str(p), recursive=True)
+                shutil.rmtree(s)
+                _emit_status("rm", path=s, recursive=True)
                 return
-            _emit_status("rm", path=str(p), error="directory, use recursive=True")
+            _emit_status("rm", path=s, error="directory, use recursive=True")
             return
-        if p.exists():
-            p.unlink()
-            _emit_status("rm", path=str(p))
+        if os.path.exists(s):
+            os.unlink(s)
+            _emit_status("rm", path=s)
         else:
-            _emit_status("rm", path=str(p), error="missing")
+            _emit_status("rm", path=s, error="missing")
 
     @_category("File ops")
     def mv(src: str | Path, dst: str | Path) -> Path:
         """Move or rename a file/directory."""
-        src_p = Path(src)
-        dst_p = Path(dst)
-        dst_p.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(src_p), str(dst_p))
-        _emit_status("mv", src=str(src_p), dst=str(dst_p))
-        return dst_p
+        src_s = os.fspath(src)
+        dst_s = os.fspath(dst)
+        parent = os.path.dirname(dst_s)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        shutil.move(src_s, dst_s)
+        _emit_status("mv", src=src_s, dst=dst_s)
+        return Path(dst_s)
 
     @_category("File ops")
     def cp(src: str | Path, dst: str | Path) -> Path:
         """Copy a file or directory."""
-        src_p = Path(src)
-        dst_p = Path(dst)
-        dst_p.parent.mkdir(parents=True, exist_ok=True)
-        if src_p.is_dir():
-            shutil.copytree(src_p, dst_p, dirs_exist_ok=True)
+        src_s = os.fspath(src)
+        dst_s = os.fspath(dst)
+        parent = os.path.dirname(dst_s)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        if os.path.isdir(src_s):
+            shutil.copytree(src_s, dst_s, dirs_exist_ok=True)
         else:
-            shutil.copy2(src_p, dst_p)
-        _emit_status("cp", src=str(src_p), dst=str(dst_p))
-        return dst_p
+            shutil.copy2(src_s, dst_s)
+        _emit_status("cp", src=src_s, dst=dst_s)
+        return Path(dst_s)
 
     def _load_gitignore_patterns(base: Path) -> list[str]:
         """Load .gitignore patterns from base directory and parents."""
@@ -151,6 +287,79 @@ if "__omp_prelude_loaded__" not in globals():
                 return True
         return False
 
+    def _seg_rx(seg: str) -> str:
+        """Regex fragment for one glob segment; wildcards never cross '/'."""
+        out = []
+        i = 0
+        n = len(seg)
+        while i < n:
+            c = seg[i]
+            if c == "*":
+                out.append("[^/]*")
+            elif c == "?":
+                out.append("[^/]")
+            elif c == "[":
+                j = i + 1
+                if j < n and seg[j] in ("!", "]"):
+                    j += 1
+                while j < n and seg[j] != "]":
+                    j += 1
+                if j >= n:
+                    out.append("\\[")
+                else:
+                    cls = seg[i + 1 : j]
+                    if cls.startswith("!"):
+                        cls = "^" + cls[1:]
+                    out.append(f"[{cls}]")
+                    i = j
+            else:
+                out.append(re.escape(c))
+            i += 1
+        return "".join(out)
+
+    def _glob_rx(pattern: str) -> re.Pattern:
+        """Compiled regex for a multi-segment glob against a relative path.
+
+        Mirrors Path.rglob semantics: '*'/'?' stay within one path segment,
+        '**' spans segments, and the pattern may match at any depth below
+        the base. Plain fnmatch would let '*' cross '/'.
+        """
+        parts = ["(?:[^/]+/)*"]
+        segs = pattern.split(os.sep)
+        last = len(segs) - 1
+        for i, seg in enumerate(segs):
+            if seg == "**":
+                parts.append("(?:[^/]+/)*" if i < last else ".*")
+            else:
+                parts.append(_seg_rx(seg) + ("" if i == last else "/"))
+        return _rx("".join(parts) + r"\Z")
+
+    def _walk_files(base: str, glob_pattern: str = "*", *, hidden: bool = False):
+        """Yield file paths (as strings) under base matching glob_pattern.
+
+        Uses os.walk (scandir-backed) instead of Path.rglob: no per-entry Path
+        allocation and no redundant stat() calls, which dominate large walks.
+        """
+        match_rel = os.sep in glob_pattern
+        # Translate the glob once and bind the compiled matcher; fnmatchcase
+        # would redo its own cache lookup and call dispatch per name.
+        if match_rel:
+            match = _glob_rx(glob_pattern).match
+        else:
+            match = _rx(fnmatch.translate(glob_pattern)).match
+        for root, dirnames, filenames in os.walk(base):
+            if not hidden:
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if not hidden and name.startswith("."):
+                    continue
+                if match_rel:
+                    fp = os.path.join(root, name)
+                    if match(os.path.relpath(fp, base)):
+                        yield fp
+                elif match(name):
+                    yield os.path.join(root, name)
+
     @_category("Search")
     def find(
         pattern: str,
@@ -168,30 +377,45 @@ if "__omp_prelude_loaded__" not in globals():
         maxdepth/mindepth are relative to path (0 = path itself, 1 = direct children).
         """
         p = Path(path).resolve()
-        base_depth = len(p.parts)
+        base = str(p)
         ignore_patterns = _load_gitignore_patterns(p)
+        match_rel = os.sep in pattern
+        if match_rel:
+            match = _glob_rx(pattern).match
+        else:
+            match = _rx(fnmatch.translate(pattern)).match
         matches: list[Path] = []
-        for m in p.rglob(pattern):
+        for root, dirnames, filenames in os.walk(base):
             if len(matches) >= limit:
                 break
-            # Check depth constraints
-            rel_depth = len(m.resolve().parts) - base_depth
-            if maxdepth is not None and rel_depth > maxdepth:
+            if not hidden:
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            rel_root = os.path.relpath(root, base)
+            entry_depth = 1 if rel_root == "." else rel_root.count(os.sep) + 2
+            if maxdepth is not None and entry_depth > maxdepth:
+                dirnames[:] = []
                 continue
-            if mindepth is not None and rel_depth < mindepth:
-                continue
-            # Skip hidden files unless requested
-            if not hidden and any(part.startswith(".") for part in m.parts):
-                continue
-            # Skip gitignored paths
-            if _match_gitignore(m, ignore_patterns, p):
-                continue
-            # Filter by type
-            if type == "file" and m.is_dir():
-                continue
-            if type == "dir" and not m.is_dir():
-                continue
-            matches.append(m)
+            candidates = [] if type == "dir" else filenames
+            if type != "file":
+                candidates = candidates + dirnames
+            for name in candidates:
+                if len(matches) >= limit:
+                    break
+                if not hidden and name.startswith("."):
+                    continue
+                if mindepth is not None and entry_depth < mindepth:
+                    continue
+                fp = os.path.join(root, name)
+                if match_rel:
+                    if not match(os.path.relpath(fp, base)):
+                        continue
+                elif not match(name):
+                    continue
+                m = Path(fp)
+                # Skip gitignored paths
+                if _match_gitignore(m, ignore_patterns, p):
+                    continue
+                matches.append(m)
         if sort_by_mtime:
             matches.sort(key=lambda x: x.stat().st_mtime, reverse=True)
         else:
@@ -210,33 +434,67 @@ if "__omp_prelude_loaded__" not in globals():
     ) -> list[tuple[int, str]]:
         """Grep a single file. Returns (line_number, text) tuples."""
         p = Path(path)
-        lines = p.read_text(encoding="utf-8").splitlines()
-        if literal:
-            if ignore_case:
-                match_fn = lambda line: pattern.lower() in line.lower()
+        # An empty pattern matches everywhere; the offset walk can't advance
+        # past it, so route it to the text path (which matches every line).
+        is_literal = bool(pattern) and not ignore_case and (literal or not _LITERAL_RE.search(pattern))
+        big = p.stat().st_size > _MMAP_THRESHOLD
+        fd = -1
+        mm = None
+        try:
+            if is_literal:
+                # Bytes-domain scan: map match offsets to line numbers through
+                # the newline index - no per-line str allocation, and only the
+                # lines that get returned are ever decoded. Large files are
+                # mmap'd so there is no full-buffer copy either. Only literal
+                # patterns are safe here: bytes-domain re (ASCII-only \w/\b,
+                # no Unicode casefolding, per-byte '.') answers differently on
+                # multibyte content, and results must not depend on file size.
+                if big:
+                    fd, mm = _mmap_ro(p)
+                    data = mm
+                else:
+                    data = p.read_bytes()
+                nls = _newline_index(data)
+                total = _line_count(data, nls)
+                match_lines: set[int] = set()
+                pat_b = pattern.encode("utf-8")
+                k = data.find(pat_b)
+                while k >= 0:
+                    ln = bisect.bisect_right(nls, k) + 1
+                    match_lines.add(ln)
+                    # One hit per line is enough; resume past its newline.
+                    line_end = nls[ln - 1] + 1 if ln - 1 < len(nls) else len(data)
+                    k = data.find(pat_b, line_end)
+                def line_at(ln: int) -> str:
+                    s, e = _line_span(data, nls, ln)
+                    return data[s:e].decode("utf-8", "replace")
             else:
-                match_fn = lambda line: pattern in line
-        else:
-            flags = re.IGNORECASE if ignore_case else 0
-            rx = re.compile(pattern, flags)
-            match_fn = lambda line: rx.search(line) is not None
-        
-        match_lines: set[int] = set()
-        for i, line in enumerate(lines, 1):
-            if match_fn(line):
-                match_lines.add(i)
-        
-        # Expand with context
-        if context > 0:
-            expanded: set[int] = set()
-            for ln in match_lines:
-                for offset in range(-context, context + 1):
-                    expanded.add(ln + offset)
-            output_lines = sorted(ln for ln in expanded if 1 <= ln <= len(lines))
-        else:
-            output_lines = sorted(match_lines)
-        
-        hits = [(ln, lines[ln - 1]) for ln in output_lines]
+                lines = _slurp(p).splitlines()
+                total = len(lines)
+                if literal:
+                    match_fn = lambda line: pattern.lower() in line.lower()
+                else:
+                    flags = re.IGNORECASE if ignore_case else 0
+                    rx = _rx(pattern, flags)
+                    match_fn = lambda line: rx.search(line) is not None
+                match_lines = {i for i, line in enumerate(lines, 1) if match_fn(line)}
+                line_at = lambda ln: lines[ln - 1]
+
+            # Expand with context
+            if context > 0:
+                expanded: set[int] = set()
+                for ln in match_lines:
+                    for offset in range(-context, context + 1):
+                        expanded.add(ln + offset)
+                output_lines = sorted(ln for ln in expanded if 1 <= ln <= total)
+            else:
+                output_lines = sorted(match_lines)
+
+            hits = [(ln, line_at(ln)) for ln in output_lines]
+        finally:
+            if mm is not None:
+                mm.close()
+                os.close(fd)
         _emit_status("grep", pattern=pattern, path=str(p), count=len(match_lines), hits=[{"line": h[0], "text": h[1][:100]} for h in hits[:10]])
         return hits
 
@@ -252,39 +510,91 @@ if "__omp_prelude_loaded__" not in globals():
         hidden: bool = False,
     ) -> list[tuple[Path, int, str]]:
         """Recursive grep across files matching glob_pattern. Respects .gitignore."""
-        if literal:
-            if ignore_case:
-                match_fn = lambda line: pattern.lower() in line.lower()
-            else:
-                match_fn = lambda line: pattern in line
+        # Literal patterns get a bytes-domain fast path: one C-level substring
+        # scan per file, and non-matching files are never decoded or split.
+        # An empty pattern can't advance the offset walk; keep it on the
+        # per-line path, where it matches every line.
+        is_literal = bool(pattern) and not ignore_case and (literal or not _LITERAL_RE.search(pattern))
+        if is_literal:
+            pat_b = pattern.encode("utf-8")
+        elif literal:
+            match_fn = lambda line: pattern.lower() in line.lower()
         else:
             flags = re.IGNORECASE if ignore_case else 0
-            rx = re.compile(pattern, flags)
+            rx = _rx(pattern, flags)
             match_fn = lambda line: rx.search(line) is not None
-        
+
         base = Path(path)
         ignore_patterns = _load_gitignore_patterns(base)
-        hits: list[tuple[Path, int, str]] = []
-        for file_path in base.rglob(glob_pattern):
-            if len(hits) >= limit:
-                break
-            if file_path.is_dir():
-                continue
-            # Skip hidden files unless requested
-            if not hidden and any(part.startswith(".") for part in file_path.parts):
-                continue
+        files: list[Path] = []
+        for fp in _walk_files(str(base), glob_pattern, hidden=hidden):
+            file_path = Path(fp)
             # Skip gitignored paths
             if _match_gitignore(file_path, ignore_patterns, base):
                 continue
+            files.append(file_path)
+
+        def scan(file_path: Path) -> list[tuple[int, str]]:
+            found: list[tuple[int, str]] = []
             try:
-                lines = file_path.read_text(encoding="utf-8").splitlines()
+                big = file_path.stat().st_size > _MMAP_THRESHOLD
+            except OSError:
+                return found
+            if is_literal:
+                # Regex patterns stay on the decoded-text path below: bytes-
+                # domain re gives size-dependent answers on multibyte content.
+                fd = -1
+                mm = None
+                try:
+                    if big:
+                        fd, mm = _mmap_ro(file_path)
+                        data = mm
+                    else:
+                        data = file_path.read_bytes()
+                    # The text path skips binary files via its strict UTF-8
+                    # decode; sniff for NULs so the bytes path does too.
+                    if b"\0" in data[:8192]:
+                        return found
+                    k = data.find(pat_b)
+                    if k < 0:
+                        return found
+                    nls = _newline_index(data)
+                    while k >= 0:
+                        ln = bisect.bisect_right(nls, k) + 1
+                        s, e = _line_span(data, nls, ln)
+                        found.append((ln, data[s:e].decode("utf-8", "replace")))
+                        line_end = nls[ln - 1] + 1 if ln - 1 < len(nls) else len(data)
+                        k = data.find(pat_b, line_end)
+                    return found
+                except Exception:
+                    return found
+                finally:
+                    if mm is not None:
+                        mm.close()
+                        os.close(fd)
+            try:
+                lines = _slurp(file_path).splitlines()
             except Exception:
-                continue
+                return found
             for i, line in enumerate(lines, 1):
+                if match_fn(line):
+                    found.append((i, line))
+            return found
+
+        # Each file is an independent read+scan; overlap the I/O across
+        # threads and collect in walk order so output stays deterministic.
+        if len(files) < _POOL_MIN_FILES:
+            results = map(scan, files)
+        else:
+            results = _pool().map(scan, files, chunksize=8)
+        hits: list[tuple[Path, int, str]] = []
+        for file_path, found in zip(files, results):
+            if len(hits) >= limit:
+                break
+            for i, line in found:
                 if len(hits) >= limit:
                     break
-                if match_fn(line):
-                    hits.append((file_path, i, line))
+                hits.append((file_path, i, line))
         _emit_status("rgrep", pattern=pattern, path=str(base), count=len(hits), hits=[{"file": str(h[0]), "line": h[1], "text": h[2][:80]} for h in hits[:10]])
         return hits
 
@@ -292,12 +602,8 @@ if "__omp_prelude_loaded__" not in globals():
     def replace(path: str | Path, pattern: str, repl: str, *, regex: bool = False) -> int:
         """Replace text in a file (regex optional)."""
         p = Path(path)
-        data = p.read_text(encoding="utf-8")
-        if regex:
-            new, count = re.subn(pattern, repl, data)
-        else:
-            new = data.replace(pattern, repl)
-            count = data.count(pattern)
+        data = _slurp(p)
+        new, count = _do_replace(data, pattern, repl, regex=regex)
         p.write_text(new, encoding="utf-8")
         _emit_status("replace", path=str(p), count=count)
         return count
@@ -324,6 +630,10 @@ if "__omp_prelude_loaded__" not in globals():
 
     import signal as _signal
 
+    # Resolve the shell once at load; shutil.which stats PATH entries per call.
+    _BASH_PATH = shutil.which("bash")
+    _SH_PATH = shutil.which("sh")
+
     def _run_with_interrupt(args: list[str], cwd: str | None, timeout: int | None, cmd: str) -> ShellResult:
         """Run subprocess with proper interrupt handling."""
         proc = subprocess.Popen(
@@ -356,7 +666,7 @@ if "__omp_prelude_loaded__" not in globals():
     @_category("Shell")
     def run(cmd: str, *, cwd: str | Path | None = None, timeout: int | None = None) -> ShellResult:
         """Run a shell command."""
-        shell_path = shutil.which("bash") or shutil.which("sh") or "/bin/sh"
+        shell_path = _BASH_PATH or _SH_PATH or "/bin/sh"
         args = [shell_path, "-c", cmd]
         return _run_with_interrupt(args, str(cwd) if cwd else None, timeout, cmd)
 
@@ -374,21 +684,13 @@ if "__omp_prelude_loaded__" not in globals():
     @_category("Text")
     def uniq(text: str, *, count: bool = False) -> str | list[tuple[int, str]]:
         """Remove duplicate adjacent lines (like uniq)."""
+        from itertools import groupby
         lines = text.splitlines()
         if not lines:
             _emit_status("uniq", groups=0)
             return [] if count else ""
-        groups: list[tuple[int, str]] = []
-        current = lines[0]
-        current_count = 1
-        for line in lines[1:]:
-            if line == current:
-                current_count += 1
-                continue
-            groups.append((current_count, current))
-            current = line
-            current_count = 1
-        groups.append((current_count, current))
+        # groupby runs the adjacency loop in C instead of the interpreter.
+        groups: list[tuple[int, str]] = [(len(list(g)), k) for k, g in groupby(lines)]
         _emit_status("uniq", groups=len(groups), count_mode=count)
         if count:
             return groups
@@ -435,21 +737,30 @@ if "__omp_prelude_loaded__" not in globals():
         """Return directory tree."""
         base = Path(path)
         lines = []
-        def walk(p: Path, prefix: str, depth: int):
+        def walk(p: str | Path, parts: list[str], depth: int):
             if depth > max_depth:
                 return
-            items = sorted(p.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower()))
-            items = [i for i in items if show_hidden or not i.name.startswith(".")]
-            for i, item in enumerate(items):
-                is_last = i == len(items) - 1
-                connector = "└── " if is_last else "├── "
-                suffix = "/" if item.is_dir() else ""
-                lines.append(f"{prefix}{connector}{item.name}{suffix}")
-                if item.is_dir():
-                    ext = "    " if is_last else "│   "
-                    walk(item, prefix + ext, depth + 1)
+            # is_dir(follow_symlinks=False) reads the d_type scandir already
+            # fetched - zero extra syscalls - so resolve it once per entry.
+            with os.scandir(p) as it:
+                entries = [
+                    (e.is_dir(follow_symlinks=False), e)
+                    for e in it
+                    if show_hidden or not e.name.startswith(".")
+                ]
+            entries.sort(key=lambda t: (not t[0], t[1].name.lower()))
+            prefix = "".join(parts)
+            last = len(entries) - 1
+            for i, (is_dir, entry) in enumerate(entries):
+                connector = "└── " if i == last else "├── "
+                suffix = "/" if is_dir else ""
+                lines.append(f"{prefix}{connector}{entry.name}{suffix}")
+                if is_dir:
+                    parts.append("    " if i == last else "│   ")
+                    walk(entry.path, parts, depth + 1)
+                    parts.pop()
         lines.append(str(base) + "/")
-        walk(base, "", 1)
+        walk(base, [], 1)
         out = "\n".join(lines)
         _emit_status("tree", path=str(base), entries=len(lines) - 1, preview=out[:1000])
         return out
@@ -457,17 +768,20 @@ if "__omp_prelude_loaded__" not in globals():
     @_category("Navigation")
     def stat(path: str | Path) -> dict:
         """Get file/directory info."""
-        p = Path(path)
-        s = p.stat()
+        s_path = os.fspath(path)
+        # One os.stat answers everything; is_file()/is_dir() on a Path would
+        # each issue another stat for the same inode.
+        st = os.stat(s_path)
+        is_dir = S_ISDIR(st.st_mode)
         info = {
-            "path": str(p),
-            "size": s.st_size,
-            "is_file": p.is_file(),
-            "is_dir": p.is_dir(),
-            "mtime": datetime.fromtimestamp(s.st_mtime).isoformat(),
-            "mode": oct(s.st_mode),
+            "path": s_path,
+            "size": st.st_size,
+            "is_file": S_ISREG(st.st_mode),
+            "is_dir": is_dir,
+            "mtime": datetime.fromtimestamp(st.st_mtime).isoformat(),
+            "mode": oct(st.st_mode),
         }
-        _emit_status("stat", path=str(p), size=s.st_size, is_dir=p.is_dir(), mtime=info["mtime"])
+        _emit_status("stat", path=s_path, size=st.st_size, is_dir=is_dir, mtime=info["mtime"])
         return info
 
     @_category("Batch")
@@ -475,9 +789,19 @@ if "__omp_prelude_loaded__" not in globals():
         """Compare two files, return unified diff."""
         import difflib
         path_a, path_b = Path(a), Path(b)
-        lines_a = path_a.read_text(encoding="utf-8").splitlines(keepends=True)
-        lines_b = path_b.read_text(encoding="utf-8").splitlines(keepends=True)
-        result = difflib.unified_diff(lines_a, lines_b, fromfile=str(path_a), tofile=str(path_b))
+        text_a = _slurp(path_a)
+        text_b = _slurp(path_b)
+        # Identical files are the common case; one string compare (a memcmp)
+        # beats running the diff algorithm to learn there is no diff.
+        if text_a == text_b:
+            _emit_status("diff", file_a=str(path_a), file_b=str(path_b), identical=True, preview="")
+            return ""
+        result = difflib.unified_diff(
+            text_a.splitlines(keepends=True),
+            text_b.splitlines(keepends=True),
+            fromfile=str(path_a),
+            tofile=str(path_b),
+        )
         out = "".join(result)
         _emit_status("diff", file_a=str(path_a), file_b=str(path_b), identical=not out, preview=out[:500])
         return out
@@ -504,8 +828,8 @@ if "__omp_prelude_loaded__" not in globals():
     def sed(path: str | Path, pattern: str, repl: str, *, flags: int = 0) -> int:
         """Regex replace in file (like sed -i). Returns count."""
         p = Path(path)
-        data = p.read_text(encoding="utf-8")
-        new, count = re.subn(pattern, repl, data, flags=flags)
+        data = _slurp(p)
+        new, count = _do_replace(data, pattern, repl, flags=flags)
         p.write_text(new, encoding="utf-8")
         _emit_status("sed", path=str(p), count=count)
         return count
@@ -523,29 +847,51 @@ if "__omp_prelude_loaded__" not in globals():
         """Recursive sed across files matching glob_pattern. Respects .gitignore."""
         base = Path(path)
         ignore_patterns = _load_gitignore_patterns(base)
-        total = 0
-        files_changed = 0
-        changed_files = []
-        for file_path in base.rglob(glob_pattern):
-            if file_path.is_dir():
-                continue
-            # Skip hidden files unless requested
-            if not hidden and any(part.startswith(".") for part in file_path.parts):
-                continue
+        files: list[Path] = []
+        for fp in _walk_files(str(base), glob_pattern, hidden=hidden):
+            file_path = Path(fp)
             # Skip gitignored paths
             if _match_gitignore(file_path, ignore_patterns, base):
                 continue
+            files.append(file_path)
+
+        # Most files in a recursive sed contain no match; make that case as
+        # cheap as possible before paying for substitution.
+        pat_b = pattern.encode("utf-8") if flags == 0 and not _LITERAL_RE.search(pattern) else None
+
+        def apply(file_path: Path) -> int:
             try:
-                data = file_path.read_text(encoding="utf-8")
-                new, count = re.subn(pattern, repl, data, flags=flags)
+                raw = file_path.read_bytes()
+                # Literal pattern absent from the raw bytes: skip the decode.
+                if pat_b is not None and pat_b not in raw:
+                    return 0
+                data = raw.decode("utf-8")
+                # search() bails on the first hit; subn would also build a
+                # full copy of the text just to find zero matches.
+                if pat_b is None and not _rx(pattern, flags).search(data):
+                    return 0
+                new, count = _do_replace(data, pattern, repl, flags=flags)
                 if count > 0:
                     file_path.write_text(new, encoding="utf-8")
-                    total += count
-                    files_changed += 1
-                    if len(changed_files) < 10:
-                        changed_files.append({"file": str(file_path), "count": count})
+                return count
             except Exception:
-                continue
+                return 0
+
+        # Independent read+subn+write per file; run across the pool and
+        # aggregate in walk order.
+        if len(files) < _POOL_MIN_FILES:
+            counts = map(apply, files)
+        else:
+            counts = _pool().map(apply, files, chunksize=8)
+        total = 0
+        files_changed = 0
+        changed_files = []
+        for file_path, count in zip(files, counts):
+            if count > 0:
+                total += count
+                files_changed += 1
+                if len(changed_files) < 10:
+                    changed_files.append({"file": str(file_path), "count": count})
         _emit_status("rsed", path=str(base), count=total, files=files_changed, changed=changed_files)
         return total
 
@@ -553,28 +899,49 @@ if "__omp_prelude_loaded__" not in globals():
     def lines(path: str | Path, start: int = 1, end: int | None = None) -> str:
         """Extract line range from file (1-indexed, inclusive). Like sed -n 'N,Mp'."""
         p = Path(path)
-        all_lines = p.read_text(encoding="utf-8").splitlines()
+        data = p.read_bytes()
+        nls = _newline_index(data)
+        total = _line_count(data, nls)
         if end is None:
-            end = len(all_lines)
+            end = total
         start = max(1, start)
-        end = min(len(all_lines), end)
-        selected = all_lines[start - 1 : end]
-        out = "\n".join(selected)
-        _emit_status("lines", path=str(p), start=start, end=end, count=len(selected), preview=out[:500])
+        end = min(total, end)
+        if start > end:
+            out = ""
+            count = 0
+        else:
+            # Slice the byte range covering the whole span; no line list built.
+            start_off = 0 if start == 1 else nls[start - 2] + 1
+            end_off = _line_span(data, nls, end)[1]
+            seg = data[start_off:end_off]
+            if b"\r" in seg:
+                seg = seg.replace(b"\r\n", b"\n")
+            out = seg.decode("utf-8", "replace")
+            count = end - start + 1
+        _emit_status("lines", path=str(p), start=start, end=end, count=count, preview=out[:500])
         return out
 
     @_category("Line ops")
     def delete_lines(path: str | Path, start: int, end: int | None = None) -> int:
         """Delete line range from file (1-indexed, inclusive). Like sed -i 'N,Md'."""
         p = Path(path)
-        all_lines = p.read_text(encoding="utf-8").splitlines()
+        # Splice the byte range out of a bytearray: one C-level del, no line
+        # list and no join rebuilding the whole file.
+        data = bytearray(p.read_bytes())
+        nls = _newline_index(data)
+        total = _line_count(data, nls)
         if end is None:
             end = start
         start = max(1, start)
-        end = min(len(all_lines), end)
-        count = end - start + 1
-        new_lines = all_lines[: start - 1] + all_lines[end:]
-        p.write_text("\n".join(new_lines) + ("\n" if all_lines else ""), encoding="utf-8")
+        end = min(total, end)
+        if start > end:
+            count = 0
+        else:
+            count = end - start + 1
+            start_off = 0 if start == 1 else nls[start - 2] + 1
+            end_off = nls[end - 1] + 1 if end - 1 < len(nls) else len(data)
+            del data[start_off:end_off]
+            p.write_bytes(bytes(data))
         _emit_status("delete_lines", path=str(p), start=start, end=end, count=count)
         return count
 
@@ -582,14 +949,30 @@ if "__omp_prelude_loaded__" not in globals():
     def delete_matching(path: str | Path, pattern: str, *, regex: bool = True) -> int:
         """Delete lines matching pattern. Like sed -i '/pattern/d'."""
         p = Path(path)
-        all_lines = p.read_text(encoding="utf-8").splitlines()
-        if regex:
-            rx = re.compile(pattern)
+        # An empty literal matches every line but can't advance the splice
+        # loop; the line-filter path handles it (and deletes everything).
+        if regex or not pattern:
+            all_lines = _slurp(p).splitlines()
+            rx = _rx(pattern)
             new_lines = [l for l in all_lines if not rx.search(l)]
+            count = len(all_lines) - len(new_lines)
+            p.write_text("\n".join(new_lines) + ("\n" if all_lines else ""), encoding="utf-8")
         else:
-            new_lines = [l for l in all_lines if pattern not in l]
-        count = len(all_lines) - len(new_lines)
-        p.write_text("\n".join(new_lines) + ("\n" if all_lines else ""), encoding="utf-8")
+            # Literal match: find each occurrence and splice its whole line
+            # out of the bytearray in place.
+            data = bytearray(p.read_bytes())
+            pat_b = pattern.encode("utf-8")
+            count = 0
+            k = data.find(pat_b)
+            while k >= 0:
+                line_start = data.rfind(b"\n", 0, k) + 1
+                j = data.find(b"\n", k)
+                line_end = len(data) if j < 0 else j + 1
+                del data[line_start:line_end]
+                count += 1
+                k = data.find(pat_b, line_start)
+            if count:
+                p.write_bytes(bytes(data))
         _emit_status("delete_matching", path=str(p), pattern=pattern, count=count)
         return count
 
@@ -597,18 +980,33 @@ if "__omp_prelude_loaded__" not in globals():
     def insert_at(path: str | Path, line_num: int, text: str, *, after: bool = True) -> Path:
         """Insert text at line. after=True (sed 'Na\\'), after=False (sed 'Ni\\')."""
         p = Path(path)
-        all_lines = p.read_text(encoding="utf-8").splitlines()
+        data = bytearray(p.read_bytes())
+        nls = _newline_index(data)
+        total = _line_count(data, nls)
         new_lines = text.splitlines()
-        line_num = max(1, min(len(all_lines) + 1, line_num))
+        line_num = max(1, min(total + 1, line_num))
         if after:
-            idx = min(line_num, len(all_lines))
-            all_lines = all_lines[:idx] + new_lines + all_lines[idx:]
+            idx = min(line_num, total)
             pos = "after"
         else:
             idx = line_num - 1
-            all_lines = all_lines[:idx] + new_lines + all_lines[idx:]
             pos = "before"
-        p.write_text("\n".join(all_lines) + "\n", encoding="utf-8")
+        # Byte offset just past line idx; splice the payload in place.
+        if idx <= 0:
+            off = 0
+        elif idx - 1 < len(nls):
+            off = nls[idx - 1] + 1
+        else:
+            off = len(data)
+        if not new_lines:
+            # Nothing to insert; leave the file untouched.
+            _emit_status("insert_at", path=str(p), line=line_num, lines_inserted=0, position=pos)
+            return p
+        payload = ("\n".join(new_lines) + "\n").encode("utf-8")
+        if off == len(data) and data and data[-1] != 0x0A:
+            payload = b"\n" + payload
+        data[off:off] = payload
+        p.write_bytes(bytes(data))
         _emit_status("insert_at", path=str(p), line=line_num, lines_inserted=len(new_lines), position=pos)
         return p
 
@@ -667,7 +1065,7 @@ if "__omp_prelude_loaded__" not in globals():
                 not_found.append(output_id)
                 continue
             
-            raw_content = output_path.read_text(encoding="utf-8")
+            raw_content = _slurp(output_path)
             raw_lines = raw_content.splitlines()
             total_lines = len(raw_lines)
             
@@ -813,19 +1211,23 @@ if "__omp_prelude_loaded__" not in globals():
         
         return current
 
+    # The helper set is fixed at load time, so the docs are computed once;
+    # inspect.signature alone costs ~100 us per helper.
+    _PRELUDE_DOCS_CACHE: list[dict[str, str]] | None = None
+
     def __omp_prelude_docs__() -> list[dict[str, str]]:
         """Return prelude helper docs for templating. Discovers functions by _omp_category attribute."""
+        global _PRELUDE_DOCS_CACHE
+        if _PRELUDE_DOCS_CACHE is not None:
+            return _PRELUDE_DOCS_CACHE
         helpers: list[dict[str, str]] = []
-        for name, obj in globals().items():
-            if not callable(obj) or not hasattr(obj, "_omp_category"):
-                continue
-            signature = str(inspect.signature(obj))
-            doc = inspect.getdoc(obj) or ""
-            docline = doc.splitlines()[0] if doc else ""
+        for fn in _CATEGORIZED:
+            doc = inspect.getdoc(fn) or ""
             helpers.append({
-                "name": name,
-                "signature": signature,
-                "docstring": docline,
-                "category": obj._omp_category,
+                "name": fn.__name__,
+                "signature": str(inspect.signature(fn)),
+                "docstring": doc.split("\n", 1)[0],
+                "category": fn._omp_category,
             })
-        return sorted(helpers, key=lambda h: (h["category"], h["name"]))
+        _PRELUDE_DOCS_CACHE = sorted(helpers, key=lambda h: (h["category"], h["name"]))
+        return _PRELUDE_DOCS_CACHE